@@ -3,9 +3,13 @@ Core data operations for FP-Ops that provide ergonomic data handling
 without expanding the DSL significantly.
 """
 from __future__ import annotations
-from typing import Any, Dict, List, Callable, TypeVar, Union, Tuple, Optional, cast, Type, overload, Protocol, runtime_checkable
+import asyncio
+import re
+import sys
+from typing import Any, Dict, List, Callable, TypeVar, Union, Tuple, Optional, Type, overload, Protocol, runtime_checkable
 from dataclasses import is_dataclass
-from functools import reduce
+from functools import lru_cache
+from expression import Result
 from fp_ops import operation, Operation
 
 """
@@ -27,11 +31,103 @@ to functional composition and reusability.
 """
 
 
+_MISSING = object()
+
+# Dots and brackets both separate path segments: "items[0].id" == "items.0.id"
+_PATH_SEPARATORS = re.compile(r'[.\[\]]+')
+
+# Defaults that ``get`` may share a cached Operation for. Equal values of
+# these exact types are interchangeable; containers are not (``(True,)``
+# equals ``(1,)``), and neither are floats (``0.0`` equals ``-0.0``).
+_CACHEABLE_DEFAULTS = frozenset({type(None), bool, int, str})
+
+
+def _compile_get(path: str, default: Any) -> Callable[[Any], Any]:
+    """
+    Parse *path* once and return a plain accessor function for it.
+    Shared by ``get`` and ``map_get``.
+    """
+    # Interned keys let dict lookups succeed on the identity check when the
+    # stored keys are interned too (identifiers, literals, JSON keys, ...)
+    parts = [sys.intern(part) for part in _PATH_SEPARATORS.split(path) if part]
+    if not parts:
+        return lambda data: data if data is not None else default
+
+    parts_idx = [int(part) if part.isdecimal() else None for part in parts]
+    segments = tuple(zip(parts, parts_idx))
+
+    if len(segments) == 1:
+        # Most paths are a single key: skip the loop entirely
+        key, idx = segments[0]
+
+        if idx is None:
+            def _get_key(data: Any) -> Any:
+                if type(data) is dict:
+                    return data.get(key, default)
+                if data is None:
+                    return default
+                if isinstance(data, dict):
+                    return data.get(key, default)
+                return getattr(data, key, default)
+
+            return _get_key
+
+        def _get_index(data: Any) -> Any:
+            kind = type(data)
+            if kind is dict:
+                return data.get(key, default)
+            if kind is list or kind is tuple:
+                return data[idx] if idx < len(data) else default
+            if data is None:
+                return default
+            if isinstance(data, dict):
+                return data.get(key, default)
+            if isinstance(data, (list, tuple)):
+                return data[idx] if idx < len(data) else default
+            return getattr(data, key, default)
+
+        return _get_index
+
+    def _get_inner(data: Any) -> Any:
+        current = data
+
+        for part, idx in segments:  # segments and default are from the outer scope
+            if current is None:
+                return default
+
+            # Exact container types first: a type() identity check is cheaper
+            # than walking the MRO with isinstance
+            kind = type(current)
+            if kind is dict:
+                current = current.get(part, _MISSING)
+            elif (kind is list or kind is tuple) and idx is not None:
+                current = current[idx] if idx < len(current) else _MISSING
+            # Subclasses (defaultdict, OrderedDict, namedtuple, ...)
+            elif isinstance(current, dict):
+                current = current.get(part, _MISSING)
+            elif idx is not None and isinstance(current, (list, tuple)):
+                current = current[idx] if idx < len(current) else _MISSING
+            # Finally try attribute access
+            else:
+                current = getattr(current, part, _MISSING)
+
+            if current is _MISSING:
+                return default
+
+        return current
+
+    return _get_inner
+
+
 def get(path: str, default: Any = None) -> Operation[[Any], Any]:
     """
     Access nested data using dot notation or dict keys.
     Configured with a path and an optional default value.
     The returned operation takes the data object as input.
+
+    The default is returned only when the path cannot be resolved (missing
+    key, out-of-range index, missing attribute, or a ``None`` along the way).
+    A value that is explicitly stored as ``None`` is returned as-is.
     
     Examples:
         # Assuming 'data' is the dict or object to access
@@ -47,33 +143,43 @@ def get(path: str, default: Any = None) -> Operation[[Any], Any]:
         #   get("user.profile.email", "notfound@example.com")
         # )
     """
-    def _get_inner(data: Any) -> Any:
-        if not path:  # path and default are from the outer scope
-            return data
-            
-        parts = path.replace('[', '.').replace(']', '').split('.')
-        current = data
-        
-        for part in parts:
-            if current is None:
-                return default
-                
-            # Try dict access first
-            if isinstance(current, dict):
-                current = current.get(part, None)
-            # Then try numeric index for sequences
-            elif isinstance(current, (list, tuple)) and part.isdigit():
-                idx = int(part)
-                current = current[idx] if 0 <= idx < len(current) else None
-            # Finally try attribute access
-            elif hasattr(current, part):
-                current = getattr(current, part)
-            else:
-                return default
-                
-        return current if current is not None else default
+    if type(default) not in _CACHEABLE_DEFAULTS:
+        return operation(_compile_get(path, default))
+    return _cached_get(path, default)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _cached_get(path: str, default: Any) -> Operation[[Any], Any]:
+    """
+    ``get`` operations are immutable for a given ``(path, default)``, so the
+    same Operation is shared by every call site asking for it.
+    """
+    return operation(_compile_get(path, default))
+
+
+def map_get(path: str, default: Any = None) -> Operation[[Union[List[Any], Dict[str, Any]]], Union[List[Any], Dict[str, Any]]]:
+    """
+    Apply ``get(path, default)`` to each item in a list or each value in a dict.
 
-    return operation(_get_inner)
+    Equivalent to ``map(get(path, default))``, but the accessor is called
+    directly for every item instead of executing one Operation per item.
+
+    Example:
+        # users = [{"user": {"email": "a@example.com"}}, {"user": {}}]
+        # emails = await map_get("user.email", "unknown").execute(users)
+        # Result: ["a@example.com", "unknown"]
+    """
+    accessor = _compile_get(path, default)
+
+    def _map_get(
+        items: Union[List[Any], Dict[str, Any]],
+        **op_kwargs: Any
+    ) -> Union[List[Any], Dict[str, Any]]:
+        if isinstance(items, dict):
+            return {key: accessor(value) for key, value in items.items()}
+        return [accessor(item) for item in items]
+
+    return operation(_map_get)
 
 
 async def _resolve_operation(op: "Operation", data: Any, **kwargs: Any) -> Any:
@@ -84,11 +190,8 @@ async def _resolve_operation(op: "Operation", data: Any, **kwargs: Any) -> Any:
     current: "Operation | None" = op
 
     while isinstance(current, Operation):
-        res = await current.execute(data, **kwargs)
-        if not res.is_ok():
-            return None
-
-        value = res.default_value(None)
+        # default_value already yields None for an Error result
+        value = (await current.execute(data, **kwargs)).default_value(None)
         if isinstance(value, Operation):
             current = value                     # loop again
         else:
@@ -116,17 +219,199 @@ class PydanticV1Model(Protocol):
     @classmethod
     def parse_obj(cls, obj: Any) -> Any: ...
 
+# Kinds of schema values, resolved once when ``build`` is called.
+_STATIC, _CALLABLE, _OPERATION, _NESTED = range(4)
+# Extra kinds used only in compiled plans; each has a single payload shape
+_DIRECT = 4             # callable called without error handling (``safe=False``)
+_NESTED_SYNC = 5        # nested schema compiled by ``_compile_schema_sync``
+_NESTED_OPERATION = 6   # nested schema pre-built into an Operation
+_INLINE = 7             # function of a simple sync Operation (``Operation._raw_fn``)
+_MIXED_DICT = 8         # ``merge`` source dict holding Operations, as entries
+
+# Operations a sync builder left for its caller to execute, as
+# ``(result dict, key, Operation, input data)``
+_Pending = List[Tuple[Dict[str, Any], str, Operation, Any]]
+# Operation-free schemas never leave anything pending
+_NO_PENDING: _Pending = []
+
+
+def _run_inline(fn: Callable[[Any], Any], data: Any) -> Any:
+    """
+    Call an inlined Operation function the way the executor would, without
+    building a ``Result``. Returns ``_MISSING`` if the call fails.
+    """
+    try:
+        value = fn(data)
+    except Exception:
+        return _MISSING
+    if isinstance(value, Result):
+        return value.default_value(_MISSING)
+    return value
+
+
+def _resolve_inline(value: Any, data: Any) -> Any:
+    """
+    Sync counterpart of ``_resolve_operation`` for the result of an inlined
+    call: returned Operations are followed as long as they can be inlined.
+    An Operation that has to be executed is returned as is.
+    """
+    while isinstance(value, Operation):
+        fn = value._raw_fn
+        if fn is None:
+            return value
+        value = _run_inline(fn, data)
+    return None if value is _MISSING else value
+
+
+async def _resolve_pending(pending: _Pending, **kwargs: Any) -> None:
+    """Execute the Operations left by a sync builder and store their values."""
+    for result, key, op, data in pending:
+        result[key] = await _resolve_operation(op, data, **kwargs)
+
+
+def _schema_kind(value: Any) -> int:
+    """Classify a schema value the same way ``build`` treats it."""
+    if isinstance(value, Operation):
+        return _OPERATION
+    if isinstance(value, dict):
+        return _NESTED
+    # Callables, but not built-in types
+    if callable(value) and not isinstance(value, (type, bool, int, float, str)):
+        return _CALLABLE
+    return _STATIC
+
+
+def _schema_operations(schema: Dict[str, Any]) -> List[Operation]:
+    """Every Operation in *schema*, including those in nested schemas."""
+    operations: List[Operation] = []
+    for value in schema.values():
+        kind = _schema_kind(value)
+        if kind == _OPERATION:
+            operations.append(value)
+        elif kind == _NESTED:
+            operations.extend(_schema_operations(value))
+    return operations
+
+
+def _schema_needs_async(schema: Dict[str, Any]) -> bool:
+    """True if *schema* (or any nested schema) has an Operation that can't be inlined."""
+    return any(op._raw_fn is None for op in _schema_operations(schema))
+
+
+def _compile_schema_sync(
+    schema: Dict[str, Any],
+    safe: bool = True
+) -> Callable[[Any, _Pending], Dict[str, Any]]:
+    """
+    Lower *schema* into a plain function building the dict.
+
+    Every value is classified once up front, so building only has to walk a
+    list of ``(key, kind, payload)`` entries. Nested schemas are compiled
+    recursively into their own builder. Operations must all be inlinable
+    (see ``_schema_needs_async``); if one returns an Operation that can't be
+    inlined, that Operation is stored in its field and added to *pending*
+    for the caller to execute.
+    """
+    plan: List[Tuple[str, int, Any]] = []
+    for key, value in schema.items():
+        kind = _schema_kind(value)
+        if kind == _NESTED:
+            kind, value = _NESTED_SYNC, _compile_schema_sync(value, safe)
+        elif kind == _CALLABLE and not safe:
+            kind = _DIRECT
+        elif kind == _OPERATION:
+            kind, value = _INLINE, value._raw_fn
+        plan.append((key, kind, value))
+
+    def _build_sync(data: Any, pending: _Pending) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+
+        for key, kind, payload in plan:
+            if kind == _STATIC:
+                result[key] = payload
+            elif kind == _INLINE:
+                value = _run_inline(payload, data)
+                if value is _MISSING:
+                    value = None
+                elif isinstance(value, Operation):
+                    value = _resolve_inline(value, data)
+                    if isinstance(value, Operation):
+                        pending.append((result, key, value, data))
+                result[key] = value
+            elif kind == _NESTED_SYNC:
+                result[key] = payload(data, pending)
+            elif kind == _DIRECT:
+                result[key] = payload(data)
+            else:
+                try:
+                    result[key] = payload(data)
+                except Exception:
+                    result[key] = None
+
+        return result
+
+    return _build_sync
+
+
+def _instantiate_model(model: Type[T], result: Dict[str, Any]) -> T:
+    """Instantiate *model* (Pydantic model, dataclass or plain class) from *result*."""
+    try:
+        # Check if it's a Pydantic model using duck typing
+        if hasattr(model, 'model_validate'):
+            # Pydantic v2
+            return model.model_validate(result)    # type: ignore[attr-defined, no-any-return]
+        elif hasattr(model, 'parse_obj'):
+            # Pydantic v1
+            return model.parse_obj(result)         # type: ignore[attr-defined, no-any-return]
+        elif is_dataclass(model):
+            # Standard dataclass
+            return model(**result)
+        else:
+            # Try generic instantiation (works for most classes)
+            return model(**result)
+    except Exception as e:
+        # If model instantiation fails, you might want to handle this
+        # differently based on your error handling strategy
+        raise ValueError(f"Failed to instantiate {model.__name__}: {e}")
+
+
+def _compile_build_sync(
+    schema: Dict[str, Any],
+    model: Optional[Type[T]] = None,
+    safe: bool = True
+) -> Callable[..., Any]:
+    """
+    Compile an Operation-free *schema* (and optional *model*) into a plain builder.
+
+    The builder is what gets wrapped by ``operation``, so it accepts (and
+    ignores) the keyword arguments, such as ``context``, that the executor
+    forwards to it.
+    """
+    build_sync = _compile_schema_sync(schema, safe)
+
+    if model is None:
+        def _build_static(data: Any, **op_kwargs: Any) -> Any:
+            return build_sync(data, _NO_PENDING)
+    else:
+        def _build_static(data: Any, **op_kwargs: Any) -> Any:
+            return _instantiate_model(model, build_sync(data, _NO_PENDING))
+
+    return _build_static
+
+
 @overload
-def build(schema: Dict[str, Any]) -> Operation[[Any], Dict[str, Any]]:
+def build(schema: Dict[str, Any], *, safe: bool = True) -> Operation[[Any], Dict[str, Any]]:
     ...
 
 @overload
-def build(schema: Dict[str, Any], model: Type[T]) -> Operation[[Any], T]:
+def build(schema: Dict[str, Any], model: Type[T], *, safe: bool = True) -> Operation[[Any], T]:
     ...
 
 def build(
     schema: Dict[str, Any], 
-    model: Optional[Type[T]] = None
+    model: Optional[Type[T]] = None,
+    *,
+    safe: bool = True
 ) -> Union[Operation[[Any], Dict[str, Any]], Operation[[Any], T]]:
     """
     Build an object from a schema. Values can be static, callables, or operations.
@@ -135,6 +420,10 @@ def build(
         schema: Dictionary mapping field names to values, callables, or operations
         model: Optional model class (dataclass or Pydantic model) to instantiate
                with the built dictionary
+        safe: When True (the default), a callable that raises sets its field to
+              None. Pass False for pre-validated schemas to call them directly
+              and skip the per-field error handling; errors then fail the
+              whole operation.
     
     Returns:
         Operation that builds either a dictionary or an instance of the model class
@@ -173,6 +462,26 @@ def build(
             "price": GetText("p.price_color"),
         }, BookDetails)
     """
+    if not _schema_operations(schema):
+        # Nothing to await: build synchronously from a precompiled plan
+        return operation(_compile_build_sync(schema, model, safe))
+
+    if not _schema_needs_async(schema):
+        # Every Operation can be inlined, so the sync plan still builds the
+        # whole schema; only Operations returned by inlined calls are awaited
+        build_sync = _compile_schema_sync(schema, safe)
+
+        async def _build_inline(data: Any, **op_kwargs: Any) -> Any:
+            pending: _Pending = []
+            result = build_sync(data, pending)
+            if pending:
+                await _resolve_pending(pending, **op_kwargs)
+            if model is not None:
+                return _instantiate_model(model, result)
+            return result
+
+        return operation(_build_inline)
+
     # Quick check if any operation in schema requires context
     require_ctx = False
     ctx_type = None
@@ -189,52 +498,154 @@ def build(
         if require_ctx:
             break
     
-    async def _build(data: Any, **op_kwargs: Any) -> Any:  # Return Any to avoid type issues
-        result: Dict[str, Any] = {}
+    # Lower the schema once; nested schemas are compiled (or built) here
+    # rather than on every call
+    plan: List[Tuple[str, int, Any]] = []
+    for key, value in schema.items():
+        kind = _schema_kind(value)
+        if kind == _NESTED:
+            if _schema_needs_async(value):
+                kind, value = _NESTED_OPERATION, build(value, safe=safe)
+            else:
+                kind, value = _NESTED_SYNC, _compile_schema_sync(value, safe)
+        elif kind == _CALLABLE and not safe:
+            kind = _DIRECT
+        elif kind == _OPERATION and value._raw_fn is not None:
+            kind, value = _INLINE, value._raw_fn
+        plan.append((key, kind, value))
+
+    # Fields that must be awaited all receive the same input, so when there
+    # are several of them they are run concurrently
+    awaited = [entry for entry in plan if entry[1] in (_OPERATION, _NESTED_OPERATION)]
+    gather_awaited = len(awaited) > 1
+    if gather_awaited:
+        # The remaining fields are filled in after the gathered ones; a
+        # pre-sized copy of the key order keeps the schema's ordering
+        key_order = dict.fromkeys(schema)
+        immediate = [entry for entry in plan if entry[1] not in (_OPERATION, _NESTED_OPERATION)]
+
+    async def _await_field(kind: int, payload: Operation, data: Any, **op_kwargs: Any) -> Any:
+        if kind == _OPERATION:
+            # Fully resolve chained / nested operations
+            return await _resolve_operation(payload, data, **op_kwargs)
+        nested = await payload.execute(data, **op_kwargs)
+        if nested.is_error() and not safe:
+            raise nested.error
+        return nested.default_value({})
 
-        for key, value in schema.items():
-            if isinstance(value, Operation):
-                # Fully resolve chained / nested operations
-                result[key] = await _resolve_operation(value, data, **op_kwargs)
-            elif isinstance(value, dict):
-                # Handle nested dictionaries
-                nested = await build(value).execute(data, **op_kwargs)
-                result[key] = nested.default_value({})
-            elif callable(value) and not isinstance(value, (type, bool, int, float, str)):
-                # Handle callables (but not built-in types)
+    async def _build(data: Any, **op_kwargs: Any) -> Any:  # Return Any to avoid type issues
+        result: Dict[str, Any]
+        entries = plan
+        pending: _Pending = []
+
+        if gather_awaited:
+            result = key_order.copy()
+            values = await asyncio.gather(
+                *(_await_field(kind, payload, data, **op_kwargs) for _, kind, payload in awaited),
+                return_exceptions=True,
+            )
+            for (key, _, _), value in zip(awaited, values):
+                if isinstance(value, BaseException):
+                    raise value
+                result[key] = value
+            entries = immediate
+        else:
+            result = {}
+
+        for key, kind, payload in entries:
+            if kind == _STATIC:
+                result[key] = payload
+            elif kind == _INLINE:
+                value = _run_inline(payload, data)
+                if value is _MISSING:
+                    value = None
+                elif isinstance(value, Operation):
+                    value = await _resolve_operation(value, data, **op_kwargs)
+                result[key] = value
+            elif kind == _NESTED_SYNC:
+                result[key] = payload(data, pending)
+            elif kind == _DIRECT:
+                result[key] = payload(data)
+            elif kind == _OPERATION or kind == _NESTED_OPERATION:
+                result[key] = await _await_field(kind, payload, data, **op_kwargs)
+            else:
                 try:
-                    result[key] = value(data)
+                    result[key] = payload(data)
                 except Exception:
                     result[key] = None
-            else:
-                # Handle static values
-                result[key] = value
+
+        if pending:
+            await _resolve_pending(pending, **op_kwargs)
 
         # If a model class was provided, instantiate it
         if model is not None:
-            try:
-                # Check if it's a Pydantic model using duck typing
-                if hasattr(model, 'model_validate'):
-                    # Pydantic v2
-                    return model.model_validate(result)    # type: ignore[attr-defined]
-                elif hasattr(model, 'parse_obj'):
-                    # Pydantic v1
-                    return model.parse_obj(result)         # type: ignore[attr-defined]
-                elif is_dataclass(model):
-                    # Standard dataclass
-                    return model(**result)
-                else:
-                    # Try generic instantiation (works for most classes)
-                    return model(**result)
-            except Exception as e:
-                # If model instantiation fails, you might want to handle this
-                # differently based on your error handling strategy
-                raise ValueError(f"Failed to instantiate {model.__name__}: {e}")
+            return _instantiate_model(model, result)
         
         return result
     
     return operation(context=require_ctx, context_type=ctx_type)(_build) # type: ignore[arg-type]
 
+def map_build(
+    schema: Dict[str, Any],
+    model: Optional[Type[T]] = None,
+    *,
+    safe: bool = True
+) -> Operation[[Union[List[Any], Dict[str, Any]]], Union[List[Any], Dict[str, Any]]]:
+    """
+    Apply ``build(schema, model)`` to each item in a list or each value in a dict.
+
+    When every Operation in the schema can be inlined (plain sync operations
+    such as ``get``), the precompiled builder is called directly for every
+    item, without any per-item Operation execution; only Operations returned
+    by inlined calls are executed, for the items that produced them. Schemas
+    with other Operations are the same as ``map(build(schema, model, safe=safe))``.
+
+    Example:
+        # rows = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+        # await map_build({"key": lambda d: d["id"], "kind": "row"}).execute(rows)
+        # Result: [{"key": 1, "kind": "row"}, {"key": 2, "kind": "row"}]
+    """
+    if _schema_needs_async(schema):
+        from fp_ops.sequences import map as map_op
+        return map_op(build(schema, model, safe=safe))  # type: ignore[arg-type]
+
+    if not _schema_operations(schema):
+        builder = _compile_build_sync(schema, model, safe)
+
+        def _map_build(
+            items: Union[List[Any], Dict[str, Any]],
+            **op_kwargs: Any
+        ) -> Union[List[Any], Dict[str, Any]]:
+            if isinstance(items, dict):
+                return {key: builder(value) for key, value in items.items()}
+            return [builder(item) for item in items]
+
+        return operation(_map_build)
+
+    build_sync = _compile_schema_sync(schema, safe)
+
+    async def _map_build_inline(
+        items: Union[List[Any], Dict[str, Any]],
+        **op_kwargs: Any
+    ) -> Union[List[Any], Dict[str, Any]]:
+        pending: _Pending = []
+        if isinstance(items, dict):
+            built = {key: build_sync(value, pending) for key, value in items.items()}
+            if pending:
+                await _resolve_pending(pending, **op_kwargs)
+            if model is not None:
+                return {key: _instantiate_model(model, value) for key, value in built.items()}
+            return built
+
+        built_list = [build_sync(item, pending) for item in items]
+        if pending:
+            await _resolve_pending(pending, **op_kwargs)
+        if model is not None:
+            return [_instantiate_model(model, value) for value in built_list]
+        return built_list
+
+    return operation(_map_build_inline)
+
 def merge(*sources: Union[Dict[str, Any],
                           Callable[[Any], Dict[str, Any]],
                           Operation[[Any], Dict[str, Any]]]
@@ -287,26 +698,86 @@ def merge(*sources: Union[Dict[str, Any],
         - Later sources override earlier ones for conflicting keys
         - All sources receive the same input data (not chained)
     """
+    # Classify every source once. Dicts without Operations are merged as-is;
+    # dicts holding Operations only re-check which entries need executing.
+    def _operation_entry(op: Operation) -> Tuple[int, Any]:
+        raw_fn = op._raw_fn
+        return (_OPERATION, op) if raw_fn is None else (_INLINE, raw_fn)
+
+    plan: List[Tuple[int, Any]] = []
+    for src in sources:
+        if isinstance(src, Operation):
+            plan.append(_operation_entry(src))
+        elif callable(src):
+            plan.append((_CALLABLE, src))
+        elif any(isinstance(value, Operation) for value in src.values()):
+            plan.append((_MIXED_DICT, tuple(
+                (key, *_operation_entry(value)) if isinstance(value, Operation)
+                else (key, _STATIC, value)
+                for key, value in src.items()
+            )))
+        elif plan and plan[-1][0] == _STATIC:
+            # Fold runs of static dicts into one; later sources still win
+            plan[-1][1].update(src)
+        else:
+            plan.append((_STATIC, dict(src)))
+
+    needs_async = any(
+        kind == _OPERATION
+        or (kind == _MIXED_DICT and any(value_kind == _OPERATION for _, value_kind, _ in payload))
+        for kind, payload in plan
+    )
+
+    if not needs_async:
+        # Only static dicts, callables and inlined Operations: nothing to await
+        def _merge_sync(data: Any) -> Dict[str, Any]:
+            out: Dict[str, Any] = {}
+
+            for kind, payload in plan:
+                if kind == _STATIC:
+                    out.update(payload)
+                elif kind == _MIXED_DICT:
+                    for key, value_kind, value in payload:
+                        if value_kind == _STATIC:
+                            out[key] = value
+                        else:
+                            value = _run_inline(value, data)
+                            out[key] = None if value is _MISSING else value
+                else:
+                    update = _run_inline(payload, data) if kind == _INLINE else payload(data)
+                    if isinstance(update, dict):
+                        out.update(update)
+
+            return out
+
+        return operation(_merge_sync)
+
     async def _merge(data: Any) -> Dict[str, Any]:
         out: Dict[str, Any] = {}
 
-        for src in sources:
-            if isinstance(src, Operation):
-                res = await src.execute(data)
-                update = res.default_value({}) if res.is_ok() else {}
-            elif callable(src):
-                update = src(data)
-            else:
-                update = {}
-                for key, value in src.items():
-                    if isinstance(value, Operation):
-                        res = await value.execute(data)
-                        update[key] = res.default_value(None) if res.is_ok() else None
+        for kind, payload in plan:
+            if kind == _STATIC:
+                out.update(payload)
+            elif kind == _MIXED_DICT:
+                for key, value_kind, value in payload:
+                    if value_kind == _STATIC:
+                        out[key] = value
+                    elif value_kind == _INLINE:
+                        value = _run_inline(value, data)
+                        out[key] = None if value is _MISSING else value
                     else:
-                        update[key] = value
+                        out[key] = (await value.execute(data)).default_value(None)
+            else:
+                if kind == _OPERATION:
+                    # An Error yields None, which is skipped below
+                    update = (await payload.execute(data)).default_value(None)
+                elif kind == _INLINE:
+                    update = _run_inline(payload, data)
+                else:
+                    update = payload(data)
 
-            if isinstance(update, dict):
-                out.update(update)
+                if isinstance(update, dict):
+                    out.update(update)
 
         return out
     
@@ -325,9 +796,40 @@ def update(update_values: Dict[str, Any]) -> Operation[[Dict[str, Any]], Dict[st
         # updated_dict = await updater.execute(source_dict)
         # Result: {"a": 1, "b": 3, "c": 4}
     """
+    # Snapshot the configuration so later changes to the caller's dict
+    # don't leak into the operation
+    frozen_values = dict(update_values)
+
     @operation
     def _update_inner(source: Dict[str, Any]) -> Dict[str, Any]:
-        return {**source, **update_values}
+        # PEP 584 merge is a single C call for plain dicts; other mappings
+        # keep the unpacking form so the result is always a plain dict
+        if type(source) is dict:
+            return source | frozen_values
+        return {**source, **frozen_values}
     return _update_inner
 
 
+def update_inplace(update_values: Dict[str, Any]) -> Operation[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Like ``update``, but mutates the source dictionary instead of copying it.
+    The same (now updated) source dictionary is returned.
+
+    Only use this when nothing else holds on to the source dictionary; it
+    saves one allocation per call in hot pipelines.
+
+    Example:
+        # source_dict = {"a": 1, "b": 2}
+        # updater = update_inplace({"b": 3, "c": 4})
+        # updated_dict = await updater.execute(source_dict)
+        # Result: {"a": 1, "b": 3, "c": 4} and updated_dict is source_dict
+    """
+    frozen_values = dict(update_values)
+
+    @operation
+    def _update_inplace_inner(source: Dict[str, Any]) -> Dict[str, Any]:
+        source.update(frozen_values)
+        return source
+    return _update_inplace_inner
+
+
@@ -179,6 +179,7 @@ class Operation(Generic[P, R]):
             ctx_type=ctx_type,
             require_ctx=require_ctx,
             template=Template(),
+            raw_func=None if inspect.iscoroutinefunction(fn) else fn,
         )
 
         g = OpGraph()
@@ -460,6 +461,46 @@ class Operation(Generic[P, R]):
         """
         return len(self._graph.nodes) == 1
 
+    @property
+    def _raw_fn(self) -> Callable[..., Any] | None:
+        """The plain sync function behind this operation, if it can be called directly.
+
+        Only set for an unbound single-step operation wrapping a synchronous
+        function whose only parameter is its positional input, so it needs
+        no context and has nowhere to receive forwarded keyword arguments.
+        Calling it with the input value then does the same work as
+        ``execute`` without the executor and ``Result`` round-trip.
+
+        Returns:
+            The wrapped function, or None if the operation must be executed.
+        """
+        if (
+            self._bound_args is not None
+            or self._bound_kwargs is not None
+            or self._ctx_factory is not None
+            or not self._is_single_step()
+        ):
+            return None
+
+        spec = self._graph._nodes[self._head_id]
+        if (
+            spec.raw_func is None
+            or spec.require_ctx
+            or spec.template.args
+            or spec.template.kwargs
+            or "context" in spec.signature.parameters
+        ):
+            return None
+
+        params = list(spec.signature.parameters.values())
+        if len(params) != 1 or params[0].kind not in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            inspect.Parameter.VAR_POSITIONAL,
+        ):
+            return None
+        return spec.raw_func
+
     def tap(self, side: Callable[[R], Any]) -> "Operation[P, R]":
         """Apply a side-effect function without changing the value.
 
@@ -152,6 +152,7 @@ class OpSpec(Generic[ResultType, ContextType]):
       - the expected context type (`ctx_type`)
       - whether the operation requires a context (`require_ctx`)
       - a unified template for arguments (`template`)
+      - the original function when it is synchronous (`raw_func`)
 
     OpSpec contains no edge or graph connectivity information and holds no mutable state.
     It is used to describe the behavior and invocation details of an operation node,
@@ -169,6 +170,7 @@ class OpSpec(Generic[ResultType, ContextType]):
     ctx_type: Type[ContextType] | None
     require_ctx: bool = False
     template: Template[ResultType, ContextType] = field(default_factory=Template)
+    raw_func: Callable[..., Any] | None = None
 
     @property
     def params(self) -> Sequence[str]:
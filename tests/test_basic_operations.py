@@ -348,6 +348,22 @@ class TestSyncFunctions:
         assert error_result.is_error()
         assert isinstance(error_result.error, ZeroDivisionError)
 
+    def test_raw_fn_for_simple_sync_operation(self, fetch_data):
+        def calculate_square(n: int) -> int:
+            return n * n
+        square_op = operation(calculate_square)
+        assert square_op._raw_fn is calculate_square
+
+        # Anything the executor has to drive cannot be called directly
+        assert fetch_data._raw_fn is None                       # async
+        assert square_op(5)._raw_fn is None                     # bound
+        assert (square_op >> square_op)._raw_fn is None         # pipeline
+        assert operation(context=True)(calculate_square)._raw_fn is None
+
+        # Extra parameters could receive forwarded kwargs such as the context
+        assert operation(lambda n, **kwargs: n)._raw_fn is None
+        assert operation(lambda n, scale=2: n * scale)._raw_fn is None
+
 class TestOverloading:
     @pytest.mark.asyncio
     async def test_overloading_forwarded_args(self):
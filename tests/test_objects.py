@@ -10,7 +10,8 @@ from dataclasses import dataclass
 
 # Assuming these imports based on the provided code
 from fp_ops import operation, Operation, identity
-from fp_ops.objects import get, build, merge, update
+from fp_ops.context import BaseContext
+from fp_ops.objects import get, build, merge, update, update_inplace, map_get, map_build
 from fp_ops.primitives import _, Placeholder
 from expression import Ok, Error, Result
 
@@ -65,6 +66,31 @@ def nested_dict():
     }
 
 
+@pytest.fixture
+def execution_log(monkeypatch):
+    """Record every executed Operation, and calls to functions wrapped with ``track``."""
+    class ExecutionLog:
+        def __init__(self):
+            self.executed: List[Operation] = []
+            self.calls: Dict[str, int] = {}
+
+        def track(self, fn):
+            def tracked(data):
+                self.calls[fn.__name__] = self.calls.get(fn.__name__, 0) + 1
+                return fn(data)
+            return tracked
+
+    log = ExecutionLog()
+    original_execute = Operation.execute
+
+    def logged_execute(self, *args, **kwargs):
+        log.executed.append(self)
+        return original_execute(self, *args, **kwargs)
+
+    monkeypatch.setattr(Operation, "execute", logged_execute)
+    return log
+
+
 @pytest.fixture
 def sample_object():
     return SampleObject(
@@ -126,6 +152,15 @@ class TestGetOperation:
         assert result.is_ok()
         assert result.default_value(None) == 1
     
+    @pytest.mark.asyncio
+    async def test_get_bracket_notation_variants(self, nested_dict):
+        """Test leading, chained and nested bracket indices."""
+        result = await get("[1].price").execute(nested_dict["items"])
+        assert result.default_value(None) == 20.0
+
+        result = await get("matrix[1][0]").execute({"matrix": [[1, 2], [3, 4]]})
+        assert result.default_value(None) == 3
+
     @pytest.mark.asyncio
     async def test_get_out_of_bounds_index(self, nested_dict):
         """Test accessing out of bounds array index returns default."""
@@ -157,7 +192,15 @@ class TestGetOperation:
         result = await op.execute(simple_dict)
         assert result.is_ok()
         assert result.default_value(None) == simple_dict
-    
+
+    @pytest.mark.asyncio
+    async def test_get_empty_path_none_data(self):
+        """Test empty path on None data returns the default."""
+        op = get("", "default")
+        result = await op.execute(None)
+        assert result.is_ok()
+        assert result.default_value(None) == "default"
+
     @pytest.mark.asyncio
     async def test_get_none_data(self):
         """Test get on None data returns default."""
@@ -166,6 +209,65 @@ class TestGetOperation:
         assert result.is_ok()
         assert result.default_value(None) == "default"
     
+    @pytest.mark.asyncio
+    async def test_get_stored_none_is_not_replaced(self):
+        """Test a value explicitly stored as None is not replaced by the default."""
+        data = {"a": None, "b": {"c": None}}
+        result = await get("a", "default").execute(data)
+        assert result.is_ok()
+        assert result.default_value("unset") is None
+
+        result = await get("b.c", "default").execute(data)
+        assert result.default_value("unset") is None
+
+        # A None in the middle of the path is still a miss
+        result = await get("a.x", "default").execute(data)
+        assert result.default_value(None) == "default"
+
+    @pytest.mark.asyncio
+    async def test_get_container_subclasses(self):
+        """Test dict and tuple subclasses are traversed like their base types."""
+        from collections import OrderedDict, namedtuple
+
+        Point = namedtuple("Point", ["x", "y"])
+        data = OrderedDict(points=[Point(1, 2), Point(3, 4)])
+
+        result = await get("points.1.y").execute(data)
+        assert result.is_ok()
+        assert result.default_value(None) == 4
+
+        result = await get("points.0.1").execute(data)
+        assert result.default_value(None) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_single_index(self):
+        """Test single-segment index paths on sequences, dicts and None."""
+        op = get("1", "default")
+        assert (await op.execute([10, 20])).default_value(None) == 20
+        assert (await op.execute((10,))).default_value(None) == "default"
+        assert (await op.execute({"1": "one"})).default_value(None) == "one"
+        assert (await op.execute(None)).default_value(None) == "default"
+
+    @pytest.mark.asyncio
+    async def test_get_is_cached(self, nested_dict):
+        """Test get operations are shared per (path, default) when possible."""
+        assert get("user.name") is get("user.name")
+        assert get("user.name", 1) is not get("user.name", True)
+        assert get("user.name", []) is not get("user.name", [])
+
+        # Equal containers of differently typed items keep their own default
+        assert get("z", (True,)) is not get("z", (1,))
+        result = await get("z", (True,)).execute({})
+        assert result.default_value(None) == (True,)
+        assert type(result.default_value(None)[0]) is bool
+        result = await get("z", (1,)).execute({})
+        assert type(result.default_value(None)[0]) is int
+
+        # A shared operation can still be reused within one pipeline
+        pipeline = get("user") >> get("user")
+        result = await pipeline.execute({"user": {"user": "nested"}})
+        assert result.default_value(None) == "nested"
+
     @pytest.mark.asyncio
     async def test_get_composition(self, nested_dict):
         """Test composing multiple get operations."""
@@ -252,6 +354,66 @@ class TestBuildOperation:
         assert output["user"]["contact"]["hasPhone"] is True
         assert output["summary"]["itemCount"] == 3
     
+    @pytest.mark.asyncio
+    async def test_build_without_operations(self, nested_dict):
+        """Test schemas made only of static values, callables and nested dicts."""
+        schema = {
+            "kind": "user",
+            "type": str,  # Classes are treated as static values
+            "name": lambda d: d["user"]["name"],
+            "meta": {
+                "count": lambda d: d["metadata"]["count"],
+                "broken": lambda d: d["missing"],
+                "static": 1
+            }
+        }
+        op = build(schema)
+        result = await op.execute(nested_dict)
+        assert result.is_ok()
+        assert result.default_value(None) == {
+            "kind": "user",
+            "type": str,
+            "name": "John",
+            "meta": {"count": 3, "broken": None, "static": 1}
+        }
+
+    @pytest.mark.asyncio
+    async def test_build_without_operations_accepts_context(self, simple_dict):
+        """Test an Operation-free build ignores a forwarded context."""
+        class Ctx(BaseContext):
+            pass
+
+        @operation(context=True, context_type=Ctx)
+        def tag(data: Dict[str, Any], context: Ctx) -> Dict[str, Any]:
+            return {**data, "ctx": type(context).__name__}
+
+        op = build({"name": lambda d: d["a"], "kind": "user"})
+        result = await op.execute(simple_dict, context=Ctx())
+        assert result.is_ok()
+        assert result.default_value(None) == {"name": 1, "kind": "user"}
+
+        result = await (op >> tag).execute(simple_dict, context=Ctx())
+        assert result.is_ok()
+        assert result.default_value(None) == {"name": 1, "kind": "user", "ctx": "Ctx"}
+
+        result = await map_build({"name": lambda d: d["a"]}).execute([simple_dict], context=Ctx())
+        assert result.is_ok()
+        assert result.default_value(None) == [{"name": 1}]
+
+    @pytest.mark.asyncio
+    async def test_build_forwards_kwargs_to_operations(self, simple_dict):
+        """Test operations taking **kwargs still receive the forwarded context."""
+        class Ctx(BaseContext):
+            pass
+
+        @operation
+        def context_of(data, **kwargs):
+            return kwargs.get("context")
+
+        ctx = Ctx()
+        result = await build({"a": get("a"), "c": context_of}).execute(simple_dict, context=ctx)
+        assert result.default_value(None) == {"a": 1, "c": ctx}
+
     @pytest.mark.asyncio
     async def test_build_error_handling(self, simple_dict):
         """Test build handles errors gracefully."""
@@ -268,6 +430,120 @@ class TestBuildOperation:
         assert output["error"] is None  # Error results in None
         assert output["afterError"] == 2
     
+    @pytest.mark.asyncio
+    async def test_build_unsafe_propagates_errors(self, simple_dict):
+        """Test safe=False lets callable errors fail the whole build."""
+        failing = lambda d: d["nonexistent"]
+
+        @operation
+        async def fetch_a(data):
+            return data["a"]
+
+        for schema in (
+            {"error": failing},
+            {"safe": get("a"), "error": failing},
+            {"safe": get("a"), "nested": {"error": failing}},
+            {"nested": {"a": get("a"), "error": failing}},
+            {"nested": {"a": fetch_a, "error": failing}},
+            {"safe": fetch_a, "nested": {"a": fetch_a, "error": failing}},
+        ):
+            result = await build(schema, safe=False).execute(simple_dict)
+            assert result.is_error()
+            assert isinstance(result.error, KeyError)
+
+        # Without errors, the unsafe build produces the same output
+        schema = {"a": get("a"), "b": lambda d: d["b"], "n": {"c": lambda d: d["c"]}}
+        result = await build(schema, safe=False).execute(simple_dict)
+        assert result.default_value(None) == {"a": 1, "b": 2, "n": {"c": 3}}
+
+    @pytest.mark.asyncio
+    async def test_build_inlined_sync_operations(self, simple_dict):
+        """Test sync single-step operations behave the same when inlined."""
+        @operation
+        def fails(data):
+            raise ValueError("boom")
+
+        @operation
+        def returns_error(data):
+            return Error(ValueError("boom"))
+
+        @operation
+        def returns_ok(data):
+            return Ok(data["a"] + 1)
+
+        @operation
+        def returns_operation(data):
+            return get("b")
+
+        schema = {
+            "fails": fails,
+            "error": returns_error,
+            "ok": returns_ok,
+            "chained": returns_operation,
+        }
+        result = await build(schema).execute(simple_dict)
+        assert result.is_ok()
+        assert result.default_value(None) == {
+            "fails": None, "error": None, "ok": 2, "chained": 2
+        }
+
+        merged = await merge(fails, returns_error, {"x": returns_ok, "y": fails}).execute(simple_dict)
+        assert merged.default_value(None) == {"x": 2, "y": None}
+
+    @pytest.mark.asyncio
+    async def test_build_inlined_operations_fall_back_to_async(self, simple_dict, execution_log):
+        """Test inlined schemas run no Operations unless one returns an async Operation."""
+        @operation
+        async def fetch_b(data):
+            return data["b"]
+
+        @operation
+        def returns_async(data):
+            return fetch_b
+
+        op = build({"a": get("a"), "n": {"c": get("c"), "k": "static"}})
+        result = await op.execute(simple_dict)
+        assert result.default_value(None) == {"a": 1, "n": {"c": 3, "k": "static"}}
+        assert execution_log.executed == [op]
+
+        execution_log.executed.clear()
+        op = build({"a": get("a"), "n": {"b": returns_async}})
+        result = await op.execute(simple_dict)
+        assert result.default_value(None) == {"a": 1, "n": {"b": 2}}
+        assert fetch_b in execution_log.executed
+
+    @pytest.mark.asyncio
+    async def test_build_fallback_runs_each_field_once(self, simple_dict, execution_log):
+        """Test fields are not re-run when an inlined call returns an async Operation."""
+        @operation
+        async def fetch_b(data):
+            return data["b"]
+
+        def side_effect(data):
+            return data["a"]
+
+        def returns_async(data):
+            return fetch_b
+
+        side_effect = execution_log.track(side_effect)
+        returns_async_op = operation(execution_log.track(returns_async))
+        inner = {"s": side_effect, "x": returns_async_op}
+        expected = {"s": 1, "x": 2}
+
+        result = await build({**inner, "n": inner}).execute(simple_dict)
+        assert result.default_value(None) == {**expected, "n": expected}
+        assert execution_log.calls == {"side_effect": 2, "returns_async": 2}
+
+        execution_log.calls.clear()
+        result = await build({"b": fetch_b, "n": inner}).execute(simple_dict)
+        assert result.default_value(None) == {"b": 2, "n": expected}
+        assert execution_log.calls == {"side_effect": 1, "returns_async": 1}
+
+        execution_log.calls.clear()
+        result = await map_build(inner).execute([simple_dict, simple_dict])
+        assert result.default_value(None) == [expected, expected]
+        assert execution_log.calls == {"side_effect": 2, "returns_async": 2}
+
     @pytest.mark.asyncio
     async def test_build_with_failed_operations(self, simple_dict):
         """Test build handles failed operations."""
@@ -334,6 +610,57 @@ class TestMergeOperation:
         assert output["itemCount"] == 3
         assert output["theme"] == "dark"
     
+    @pytest.mark.asyncio
+    async def test_merge_mixed_dicts_keep_order(self, nested_dict):
+        """Test dicts with and without operations are merged in source order."""
+        op = merge(
+            {"name": "static", "theme": "light"},
+            {"name": get("user.name"), "missing": get("nope.nope")},
+            get("user.settings"),
+            {"theme": "final"}
+        )
+        result = await op.execute(nested_dict)
+        assert result.is_ok()
+        assert result.default_value(None) == {
+            "name": "John",
+            "theme": "final",
+            "missing": None,
+            "notifications": True
+        }
+
+    @pytest.mark.asyncio
+    async def test_merge_static_runs_keep_override_order(self):
+        """Test folded static dicts still respect later-wins ordering."""
+        first = {"a": 1, "b": 1}
+        op = merge(
+            first,
+            {"b": 2},
+            lambda d: {"a": d["a"], "c": d["c"]},
+            {"c": 3},
+            {"d": 4}
+        )
+        result = await op.execute({"a": 10, "c": 30})
+        assert result.default_value(None) == {"a": 10, "b": 2, "c": 3, "d": 4}
+        # The caller's dict is never modified
+        assert first == {"a": 1, "b": 1}
+
+    @pytest.mark.asyncio
+    async def test_merge_without_async_sources_is_sync(self, nested_dict):
+        """Test merge runs synchronously unless a source has to be awaited."""
+        @operation
+        async def async_source(data):
+            return {"async": True}
+
+        sync_op = merge({"a": 1}, get("user.settings"), {"name": get("user.name")})
+        assert sync_op._raw_fn is not None
+        result = await sync_op.execute(nested_dict)
+        assert result.default_value(None) == {
+            "a": 1, "theme": "dark", "notifications": True, "name": "John"
+        }
+
+        assert merge({"a": 1}, async_source)._raw_fn is None
+        assert merge({"a": async_source})._raw_fn is None
+
     @pytest.mark.asyncio
     async def test_merge_empty_sources(self):
         """Test merging with empty sources."""
@@ -399,6 +726,102 @@ class TestUpdateOperation:
         assert result.default_value(None) == {"a": 1, "b": 10, "c": 20, "d": 30}
 
 
+    @pytest.mark.asyncio
+    async def test_update_values_are_snapshotted(self, simple_dict):
+        """Test later changes to the update dict don't affect the operation."""
+        values = {"b": 10}
+        op = update(values)
+        values["b"] = 99
+        result = await op.execute(simple_dict)
+        assert result.default_value(None) == {"a": 1, "b": 10, "c": 3}
+
+    @pytest.mark.asyncio
+    async def test_update_inplace(self, simple_dict):
+        """Test update_inplace mutates and returns the source dict."""
+        op = update_inplace({"b": 10, "d": 4})
+        result = await op.execute(simple_dict)
+        assert result.is_ok()
+        output = result.default_value(None)
+        assert output is simple_dict
+        assert simple_dict == {"a": 1, "b": 10, "c": 3, "d": 4}
+
+
+# Test fused map_get / map_build operations
+class TestMapGetBuild:
+    """Test suite for map_get and map_build."""
+
+    @pytest.mark.asyncio
+    async def test_map_get_list(self, nested_dict):
+        """Test map_get over a list matches applying get to each item."""
+        op = map_get("price", 0.0)
+        result = await op.execute(nested_dict["items"] + [{"id": 4}])
+        assert result.is_ok()
+        assert result.default_value(None) == [10.5, 20.0, 15.75, 0.0]
+
+    @pytest.mark.asyncio
+    async def test_map_get_dict(self):
+        """Test map_get over a dict maps the values and keeps the keys."""
+        op = map_get("contact.email")
+        result = await op.execute({
+            "john": {"contact": {"email": "john@example.com"}},
+            "jane": {"contact": {}}
+        })
+        assert result.is_ok()
+        assert result.default_value(None) == {"john": "john@example.com", "jane": None}
+
+    @pytest.mark.asyncio
+    async def test_map_build_static_schema(self, nested_dict):
+        """Test map_build with an Operation-free schema."""
+        op = map_build({
+            "key": lambda d: d["id"],
+            "double": lambda d: d["price"] * 2,
+            "kind": "item"
+        })
+        result = await op.execute(nested_dict["items"][:2])
+        assert result.is_ok()
+        assert result.default_value(None) == [
+            {"key": 1, "double": 21.0, "kind": "item"},
+            {"key": 2, "double": 40.0, "kind": "item"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_map_build_with_operations_and_model(self, nested_dict):
+        """Test map_build falls back to map(build(...)) when the schema has Operations."""
+        @dataclass
+        class Item:
+            id: int
+            price: float
+
+        op = map_build({"id": get("id"), "price": get("price")}, Item)
+        result = await op.execute(nested_dict["items"])
+        assert result.is_ok()
+        assert result.default_value(None) == [
+            Item(1, 10.5), Item(2, 20.0), Item(3, 15.75)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_map_build_inlines_get_fields(self, nested_dict, execution_log):
+        """Test map_build runs get() fields inline, building only fallbacks per item."""
+        @operation
+        async def fetch_id(data):
+            return data["ref"]
+
+        op = map_build({"id": get("id"), "meta": {"price": get("price")}})
+        items = nested_dict["items"][:2] + [{"id": fetch_id, "ref": 3, "price": 1.0}]
+        result = await op.execute(items)
+        assert result.is_ok()
+        assert result.default_value(None) == [
+            {"id": 1, "meta": {"price": 10.5}},
+            {"id": 2, "meta": {"price": 20.0}},
+            {"id": 3, "meta": {"price": 1.0}},
+        ]
+        # Only the Operation value returned for the last item is executed
+        assert execution_log.executed == [op, fetch_id]
+
+        result = await op.execute({"x": nested_dict["items"][0]})
+        assert result.default_value(None) == {"x": {"id": 1, "meta": {"price": 10.5}}}
+
+
 # Test complex compositions and interactions
 class TestComplexCompositions:
     """Test suite for complex operation compositions."""
@@ -752,6 +1175,43 @@ class TestAsyncBehavior:
         assert output["sync"] == 21
         assert output["async"] == {"async_result": 42}
     
+    @pytest.mark.asyncio
+    async def test_concurrent_operations_in_build(self):
+        """Test awaited build fields run concurrently and keep schema order."""
+        call_order = []
+
+        @operation
+        async def slow_op1(data):
+            call_order.append("start1")
+            await asyncio.sleep(0.02)
+            call_order.append("end1")
+            return "one"
+
+        @operation
+        async def slow_op2(data):
+            call_order.append("start2")
+            await asyncio.sleep(0.01)
+            call_order.append("end2")
+            return "two"
+
+        op = build({
+            "first": slow_op1,
+            "static": True,
+            "nested": {"second": slow_op2, "value": get("value")},
+            "value": get("value")
+        })
+        result = await op.execute({"value": 1})
+        assert result.is_ok()
+        output = result.default_value(None)
+        assert list(output) == ["first", "static", "nested", "value"]
+        assert output == {
+            "first": "one",
+            "static": True,
+            "nested": {"second": "two", "value": 1},
+            "value": 1
+        }
+        assert call_order == ["start1", "start2", "end2", "end1"]
+
     @pytest.mark.asyncio
     async def test_concurrent_execution_in_merge(self):
         """Test that merge can handle concurrent operations."""